@@ -17,5 +17,9 @@ from .core.surface import Surface, initialize_surface, generate_grid, generate_d
 from .core.morphology import Morphology
 from .core.production import Production, NeukumProduction
 from .utils.general_utils import to_config, set_properties, check_properties, create_catalogue, validate_and_convert_location, normalize_coords, R_to_CSFD
-from .utils.montecarlo import get_random_location, get_random_impact_angle, get_random_velocity, get_random_size, bounded_norm
-from .cython.perlin import apply_noise
+from .utils.montecarlo import get_random_location, get_random_impact_angle, get_random_velocity, get_random_size, bounded_norm, make_rngs
+try:
+    from .cython.perlin import apply_noise
+except ImportError:
+    # The compiled Fortran extension is unavailable, so fall back to the Numba implementation
+    from .utils._noise_numba import apply_noise
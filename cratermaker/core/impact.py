@@ -70,8 +70,11 @@ class Impact(ABC):
     --------
     Crater, Projectile : Subclasses of `Impact`.
     """
-    
-    def __init__(self, 
+    # Impact objects are created in large numbers when populating a surface, so instances use __slots__ rather than a per-instance
+    # __dict__ to reduce memory use and speed up attribute access
+    __slots__ = ('_target', '_rng', '_scale_cls', '_scale', '_location', '_diameter', '_radius')
+
+    def __init__(self,
                  diameter: FloatLike = None,
                  radius: FloatLike = None,
                  location: PairOfFloats = None,
@@ -229,8 +232,12 @@ class Crater(Impact):
     shape, depth, and other morphological features.
 
     """
+    # The morphology attributes (rimheight through ejrim) are assigned by the Morphology class, and morphology_type by the
+    # scaling setters, so they must be declared here for slotted instances
+    __slots__ = ('_transient_diameter', '_transient_radius', '_morphology_cls', '_morphology', 'morphology_type',
+                 'rimheight', 'rimwidth', 'peakheight', 'floordiam', 'floordepth', 'ejrim')
 
-    def __init__(self, 
+    def __init__(self,
                 transient_diameter: FloatLike = None,
                 transient_radius: FloatLike = None,
                 morphology_cls: Type[Morphology] = None, 
@@ -409,8 +416,9 @@ class Projectile(Impact):
     velocity, material, and angle of impact.
 
     """
-    
-    def __init__(self, 
+    __slots__ = ('_density', '_mass', '_velocity', '_vertical_velocity', '_angle')
+
+    def __init__(self,
                 mass: FloatLike = None,
                 density: FloatLike = None,
                 velocity: FloatLike = None,
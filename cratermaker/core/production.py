@@ -885,7 +885,9 @@ class NeukumProduction(Production):
                 else:
                     return sum(co * np.log10(Dkm) ** i for i, co in enumerate(dcoef))
             
-            return _dNdD_scalar(Dkm) if np.isscalar(Dkm) else np.vectorize(_dNdD_scalar)(Dkm)
+            if np.isscalar(Dkm):
+                return _dNdD_scalar(Dkm)
+            return np.frompyfunc(_dNdD_scalar, 1, 1)(Dkm).astype(np.float64, copy=False)
 
     
         def _CSFD(Dkm: FloatLike | Sequence[FloatLike] | ArrayLike) -> Union[FloatLike, ArrayLike]:
@@ -915,7 +917,9 @@ class NeukumProduction(Production):
                     logCSFD = sum(co * np.log10(Dkm) ** i for i, co in enumerate(self.sfd_coef))
                     return 10 ** logCSFD
         
-            return _CSFD_scalar(Dkm) if np.isscalar(Dkm) else np.vectorize(_CSFD_scalar)(Dkm)
+            if np.isscalar(Dkm):
+                return _CSFD_scalar(Dkm)
+            return np.frompyfunc(_CSFD_scalar, 1, 1)(Dkm).astype(np.float64, copy=False)
 
 
         if np.any(diameter < 0.0):
@@ -1,20 +1,30 @@
+import math
 import numpy as np
 from numpy.random import default_rng, Generator
 import xarray as xr
 import json
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional dependency; the standard library json module is used when it is unavailable
+    orjson = None
 import os
 import tempfile
 from typing import Any, Tuple, Type
 from .target import Target, Material
 from .impact import Crater, Projectile
-from .surface import Surface, initialize_surface, save_surface, elevation_to_cartesian
+from .surface import Surface, initialize_surface, save_surface, elevation_to_cartesian_into
 from .scale import Scale
 from .morphology import Morphology
 from .production import Production, NeukumProduction
 from ..utils.general_utils import to_config, set_properties
-from ..utils.custom_types import FloatLike, PairOfFloats
+from ..utils.custom_types import FloatLike, PairOfFloats, NoiseModel
 from ..utils.mesh_tools import extract_vtk
-from ..cython.perlin import apply_noise
+try:
+    from ..cython.perlin import apply_noise
+except ImportError:
+    # The compiled Fortran extension is unavailable, so fall back to the Numba implementation
+    from ..utils._noise_numba import apply_noise
 
 _POISSON_BATCH_SIZE = 1000
 
@@ -23,7 +33,8 @@ class Simulation:
     This class orchestrates the processes involved in running a crater simulation.
 
     """
-    def __init__(self, 
+    config_fields = ['_simdir', '_seed', '_pix']  # Instance variables to consider when saving to file
+    def __init__(self,
                  target: str | Target = "Moon",
                  material: str | Material | None = None,
                  pix: FloatLike | None = None,
@@ -78,7 +89,8 @@ class Simulation:
             raise TypeError("The 'rng' argument must be a numpy.random.Generator instance or None")
         
         self._crater = None
-        self._projectile = None        
+        self._projectile = None
+        self._anchor_cache = {}  # Cached noise anchor arrays keyed by (num_octaves, scale), used when reuse_anchor is set
         
         # First we need to establish the production function. This will allow us to compute the mean impact velocity, which is needed
         # in order to instantiate the target body.
@@ -154,7 +166,8 @@ class Simulation:
         if pix is not None:
             self.pix = np.float64(pix)
         else:    
-            self.pix = np.sqrt(4 * np.pi * self.target.radius**2) * 1e-3  # Default mesh scale that is somewhat comparable to a 1000x1000 CTEM grid
+            # sqrt(4*pi*r**2) = 2*r*sqrt(pi), and math.sqrt avoids the ufunc machinery on a scalar
+            self.pix = np.float64(2.0 * math.sqrt(math.pi) * self.target.radius * 1e-3)  # Default mesh scale that is somewhat comparable to a 1000x1000 CTEM grid
 
         self.initialize_surface(pix=self.pix, target=self.target, reset_surface=reset_surface, simdir=simdir, *args, **kwargs)
         
@@ -217,10 +230,15 @@ class Simulation:
         target_config = {**to_config(self.target), 'material' : material_config}
         sim_config = {**to_config(self),'target' : target_config} 
         
-        # Write the combined configuration to a JSON file
-        with open(filename, 'w') as f:
-            json.dump(sim_config, f, indent=4)
-            
+        # Write the combined configuration to a JSON file. orjson serializes substantially faster than the standard library,
+        # which matters when the configuration is written repeatedly during long runs.
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(sim_config, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(sim_config, f, indent=4)
+
         return
     
 
@@ -310,8 +328,7 @@ class Simulation:
             self.projectile, self.crater = self.generate_projectile(**kwargs)
         else:
             self.crater, self.projectile = self.generate_crater(**kwargs)
-        self.surf['crater_distance'] = self.surf.get_node_distance(self.crater.location)
-        self.surf['crater_bearing'] = self.surf.get_node_initial_bearing(self.crater.location)
+        self.surf['crater_distance'], self.surf['crater_bearing'] = self.surf.get_node_distance_and_bearing(self.crater.location)
         
         # self.crater.average_surface_normal_vector = self.surf.get_average_surface(self.crater.location, self.crater.radius)
         self.crater.morphology.form_crater(self.surf)
@@ -395,16 +412,8 @@ class Simulation:
             # Use elevation data to modify the mesh for visualization purposes
             grid = xr.open_dataset(self.grid_file)
            
-            vert_vars = ['xVertex', 'yVertex', 'zVertex']
-            
-            ds_new = elevation_to_cartesian(grid[vert_vars], self.surf['elevation'])
-            for var in vert_vars:
-                grid[var] = ds_new[var]
-                
-            face_vars = ['xCell', 'yCell', 'zCell']
-            ds_new = elevation_to_cartesian(grid[face_vars], self.surf['elevation'].nodal_average())
-            for var in face_vars:
-                grid[var] = ds_new[var]
+            elevation_to_cartesian_into(grid, ['xVertex', 'yVertex', 'zVertex'], self.surf['elevation'])
+            elevation_to_cartesian_into(grid, ['xCell', 'yCell', 'zCell'], self.surf['elevation'].nodal_average())
             
             grid.to_netcdf(os.path.join(temp_dir, "surface_mesh.nc"))
             
@@ -430,6 +439,8 @@ class Simulation:
                     model="turbulence",
                     noise_width=1000e3,
                     noise_height=20e3,
+                    reuse_anchor=False,
+                    single_precision=False,
                     **kwargs,
                     ) -> None:
         """
@@ -445,6 +456,14 @@ class Simulation:
             The width scale of the noise in meters. The default is 1000e3 (1000 km).
         noise_height : float, optional
             The height scale of the noise in meters. The default is 20e3 (20 km).
+        reuse_anchor : bool, optional
+            If True, the randomly generated anchor array is cached per (num_octaves, scale) pair and reused on subsequent calls,
+            so that repeated calls varying only the other noise parameters sample the same underlying noise field and do not
+            advance the random number generator. The default is False. An explicitly passed 'anchor' bypasses the cache.
+        single_precision : bool, optional
+            If True, the noise field is computed in float32 rather than float64, halving the memory traffic of the noise kernels.
+            The rounding error this introduces is far below the interpolation error inherent to the noise models, so the result
+            is visually indistinguishable. The elevation update itself remains in float64. The default is False.
         **kwargs :
             Additional keyword arguments specific to the noise model. Common parameters include 'num_octaves' and 'anchor'. Model-specific parameters like 'freq', 'pers', 'slope', 'lacunarity', 'gain', etc., can also be set.
 
@@ -471,22 +490,38 @@ class Simulation:
 
         >>> sim.apply_noise(model="ridged", noise_width=500e3, num_octaves=10, freq=1.5)
         """      
+        # Resolve the model name to its integer id once, so the remaining dispatch is on enum members rather than strings
+        try:
+            model = NoiseModel[str(model).upper()]
+        except KeyError:
+            raise ValueError(f"{model} is an invalid model. Valid options are {', '.join(m.name.lower() for m in NoiseModel)}")
+
         scale = self.target.radius / noise_width
         num_octaves = kwargs.pop("num_octaves", 12)
-        anchor = kwargs.pop("anchor", self.rng.uniform(0.0,scale, size=(num_octaves, 3))) 
-        
+        anchor = kwargs.pop("anchor", None)
+        if anchor is None:
+            cache_key = (num_octaves, round(float(scale), 9))
+            if reuse_anchor and cache_key in self._anchor_cache:
+                anchor = self._anchor_cache[cache_key]
+            else:
+                anchor = self.rng.uniform(0.0,scale, size=(num_octaves, 3))
+                if reuse_anchor:
+                    self._anchor_cache[cache_key] = anchor
+        # A user-supplied anchor may be a list or a strided view; the noise kernels expect a contiguous float64 array
+        anchor = np.ascontiguousarray(anchor, dtype=np.float64)
+
         # Set reasonable default values for the different models
-        if model == "turbulence" or model == "billowed" or model == "plaw" or model == "ridged":
+        if model in (NoiseModel.TURBULENCE, NoiseModel.BILLOWED, NoiseModel.PLAW, NoiseModel.RIDGED):
             kwargs.setdefault("noise_height", noise_height)
             kwargs.setdefault("freq", 2.00)
             kwargs.setdefault("pers", 0.5)
-        if model == "plaw":
+        if model is NoiseModel.PLAW:
             kwargs.setdefault("slope", 2.0)
-        if model == "swiss" or model == "jordan":
+        if model in (NoiseModel.SWISS, NoiseModel.JORDAN):
             kwargs.setdefault("lacunarity", 2.00)
             kwargs.setdefault("gain", 0.5)
             kwargs.setdefault("warp", 0.35)
-        if model == "jordan":
+        if model is NoiseModel.JORDAN:
             kwargs.setdefault("gain0", 0.8)
             kwargs.setdefault("warp0", 0.4)
             kwargs.setdefault("damp0", 1.0)
@@ -496,18 +531,26 @@ class Simulation:
         if "noise_height" in kwargs:
             kwargs["noise_height"] = kwargs["noise_height"] / self.target.radius
             
-        vars = ['node_x', 'node_y', 'node_z']
-        ds_norm = self.surf.uxgrid._ds[vars] * scale / self.target.radius
-        x = ds_norm[vars[0]].values
-        y = ds_norm[vars[1]].values
-        z = ds_norm[vars[2]].values
-        noise = apply_noise(model, x, y, z, num_octaves, anchor, **kwargs)
+        # Extract the node coordinates as raw contiguous arrays and normalize them in NumPy rather than building an intermediate
+        # xarray Dataset, which would pay for alignment and metadata bookkeeping on what is otherwise a tight numeric operation
+        norm = np.float64(scale / self.target.radius)
+        ds = self.surf.uxgrid._ds
+        x = np.ascontiguousarray(ds['node_x'].values) * norm
+        y = np.ascontiguousarray(ds['node_y'].values) * norm
+        z = np.ascontiguousarray(ds['node_z'].values) * norm
+        if single_precision:
+            # The compiled Fortran binding operates in float64 only, so the reduced-precision path always uses the Numba kernels
+            from ..utils._noise_numba import apply_noise as apply_noise_numba
+            noise = apply_noise_numba(model.name.lower(), x.astype(np.float32), y.astype(np.float32), z.astype(np.float32),
+                                      num_octaves, anchor, **kwargs)
+        else:
+            noise = apply_noise(model.name.lower(), x, y, z, num_octaves, anchor, **kwargs)
         
         # Make sure the noise is volume-conserving (i.e., the mean is zero)
         # TODO: Take into account the nodes are not uniformly distributed on the sphere
         noise = noise - np.mean(noise)
         
-        if model =="swiss" or model == "jordan":
+        if model in (NoiseModel.SWISS, NoiseModel.JORDAN):
             self.surf['elevation'] += noise * noise_height
         else:
             self.surf['elevation'] += noise * self.target.radius 
@@ -14,6 +14,14 @@ from ..utils.mesh_tools import build_spherical_mesh
 import logging
 from .target import Target
 from ..utils.custom_types import FloatLike, PairOfFloats
+try:
+    import cupy
+except ImportError:
+    # cupy is an optional dependency; the coordinate transforms run on the CPU when it is unavailable
+    cupy = None
+
+# Minimum number of points before the radial displacement is offloaded to the GPU. Below this the transfer overhead dominates.
+_GPU_MIN_SIZE = 1_000_000
 
 # Default file names and directories
 _DATA_DIR = "surface_data"
@@ -244,10 +252,51 @@ class Surface(UxDataset):
         lon1 = np.deg2rad(location[0])
         lat1 = np.deg2rad(location[1])
         lon2 = np.deg2rad(self.uxgrid.node_lon)
-        lat2 = np.deg2rad(self.uxgrid.node_lat)             
-        return self.calculate_initial_bearing(lon1,lat1,lon2,lat2)  
-    
-    
+        lat2 = np.deg2rad(self.uxgrid.node_lat)
+        return self.calculate_initial_bearing(lon1,lat1,lon2,lat2)
+
+
+    def get_node_distance_and_bearing(self, location: Tuple[np.float64, np.float64]) -> Tuple[UxDataArray, UxDataArray]:
+        """
+        Computes the distances and initial bearings between nodes and a given location in a single pass.
+
+        This fuses :meth:`get_node_distance` and :meth:`get_node_initial_bearing` so that the node coordinate arrays are
+        traversed once and the shared trigonometric terms are computed once, rather than separately for each quantity.
+
+        Parameters
+        ----------
+        location : Tuple[np.float64, np.float64]
+            Tuple containing the longitude and latitude of the location in radians.
+
+        Returns
+        -------
+        Tuple[UxDataArray, UxDataArray]
+            DataArrays of distances in meters and initial bearings in radians for each node.
+        """
+        lon1 = np.deg2rad(location[0])
+        lat1 = np.deg2rad(location[1])
+        lon2 = np.deg2rad(self.uxgrid.node_lon)
+        lat2 = np.deg2rad(self.uxgrid.node_lat)
+
+        # Calculate differences in coordinates, and the trigonometric terms shared by the distance and bearing formulas
+        dlon = np.mod(lon2 - lon1 + np.pi, 2 * np.pi) - np.pi
+        dlat = lat2 - lat1
+        cos_lat1 = np.cos(lat1)
+        cos_lat2 = np.cos(lat2)
+
+        # Haversine formula
+        a = np.sin(dlat/2.0)**2 + cos_lat1 * cos_lat2 * np.sin(dlon/2.0)**2
+        distance = self.target_radius * 2 * np.arcsin(np.sqrt(a))
+
+        # Initial bearing, normalized to 0 to 2*pi
+        x = np.sin(dlon) * cos_lat2
+        y = cos_lat1 * np.sin(lat2) - np.sin(lat1) * cos_lat2 * np.cos(dlon)
+        initial_bearing = (np.arctan2(x, y) + 2 * np.pi) % (2 * np.pi)
+
+        return distance, initial_bearing
+
+
+
     # Function to find nearest cell index
     def find_nearest_node_index(self,point):
         """
@@ -781,24 +830,87 @@ def save_surface(surf: Surface,
     return
 
 
-def elevation_to_cartesian(position: Dataset, 
+def _displace_radially(rvec: NDArray,
+                       elev: NDArray
+                       ) -> NDArray:
+    """
+    Displace a set of Cartesian position vectors along their radial directions by the given elevations.
+
+    The transform is memory-bandwidth-bound, so when cupy is available, the device is usable, and the mesh is large enough to
+    amortize the transfers, the arithmetic is performed on the GPU.
+
+    Parameters
+    ----------
+    rvec : NDArray
+        Array of shape (n, 3) containing the Cartesian position vectors.
+    elev : NDArray
+        Array of shape (n,) containing the elevation values.
+
+    Returns
+    -------
+    NDArray
+        Array of shape (n, 3) containing the displaced position vectors.
+    """
+    if cupy is not None and rvec.shape[0] >= _GPU_MIN_SIZE and cupy.cuda.is_available():
+        rvec_d = cupy.asarray(rvec)
+        elev_d = cupy.asarray(elev)
+        runit = rvec_d / cupy.linalg.norm(rvec_d, axis=1, keepdims=True)
+        return cupy.asnumpy(rvec_d + elev_d[:, None] * runit)
+
+    runit = rvec / np.linalg.norm(rvec, axis=1, keepdims=True)
+    return rvec + elev[:, None] * runit
+
+
+def elevation_to_cartesian(position: Dataset,
                            elevation: DataArray
                            ) -> Dataset:
-    
+
     vars = list(position.data_vars)
     if len(vars) != 3:
         raise ValueError("Dataset must contain exactly three coordinate variables")
     dim_var = list(position.dims)[0]
 
     rvec = np.column_stack((position[vars[0]], position[vars[1]], position[vars[2]]))
-    runit = rvec / np.linalg.norm(rvec, axis=1, keepdims=True)
-    
+    rnew = _displace_radially(rvec, elevation.values)
+
     ds_new = Dataset(
                      {
-                      vars[0]: ((dim_var,), rvec[:,0] + elevation.values * runit[:,0]),
-                      vars[1]: ((dim_var,), rvec[:,1] + elevation.values * runit[:,1]),
-                      vars[2]: ((dim_var,), rvec[:,2] + elevation.values * runit[:,2]),
+                      vars[0]: ((dim_var,), rnew[:,0]),
+                      vars[1]: ((dim_var,), rnew[:,1]),
+                      vars[2]: ((dim_var,), rnew[:,2]),
                      }
                     )
     return ds_new
 
+
+def elevation_to_cartesian_into(ds: Dataset,
+                                vars: List[str],
+                                elevation: DataArray
+                                ) -> None:
+    """
+    Displace a set of Cartesian coordinate variables radially by an elevation field, writing the result back into the dataset.
+
+    This is the in-place equivalent of elevation_to_cartesian. It operates on the raw NumPy arrays and assigns the displaced
+    coordinates directly into the dataset, avoiding the construction of an intermediate Dataset and its associated alignment
+    bookkeeping.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The dataset containing the coordinate variables to be displaced.
+    vars : List[str]
+        The names of the three Cartesian coordinate variables in ds.
+    elevation : DataArray
+        The elevation values used to displace the coordinates along the radial direction.
+    """
+    if len(vars) != 3:
+        raise ValueError("vars must contain exactly three coordinate variable names")
+
+    rvec = np.column_stack([np.asarray(ds[var].values) for var in vars])
+    rnew = _displace_radially(rvec, elevation.values)
+
+    for i, var in enumerate(vars):
+        ds[var] = (ds[var].dims, rnew[:,i])
+
+    return
+
@@ -3,12 +3,56 @@ import os
 import xarray as xr
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Tuple, Dict, Sequence, Optional, Any
+from typing import Tuple, Dict, Sequence, Optional, Any, NamedTuple
 import os
-from ..utils.general_utils import set_properties, create_catalogue, check_properties
+from ..utils.general_utils import set_properties, check_properties
 from ..utils.custom_types import FloatLike
 import warnings
 
+class _MaterialRec(NamedTuple):
+    """Record of the crater scaling relationship terms for a single material in the built-in catalogue."""
+    K1: float
+    mu: float
+    Ybar: float
+    density: float
+
+
+class _BodyRec(NamedTuple):
+    """Record of the physical properties for a single target body in the built-in catalogue."""
+    radius: float
+    gravity: float
+    material_name: str
+    transition_scale_type: str
+
+
+# Define some default crater scaling relationship terms (see Richardson 2009, Table 1, and Kraus et al. 2011 for Ice)
+_MATERIALS = {
+    "Water":     _MaterialRec(2.30,   0.55, 0.0,    1000.0),
+    "Sand":      _MaterialRec(0.24,   0.41, 0.0,    1750.0),
+    "Dry Soil":  _MaterialRec(0.24,   0.41, 0.18e6, 1500.0),
+    "Wet Soil":  _MaterialRec(0.20,   0.55, 1.14e6, 2000.0),
+    "Soft Rock": _MaterialRec(0.20,   0.55, 7.60e6, 2250.0),
+    "Hard Rock": _MaterialRec(0.20,   0.55, 18.0e6, 2500.0),
+    "Ice":       _MaterialRec(15.625, 0.48, 0.0,    900.0),
+}
+
+# Define some built-in catalogue values for known solar system targets of interest
+_gEarth = np.float64(9.80665) # 1 g in SI units
+_BODIES = {
+    "Mercury": _BodyRec(2440.0e3,  0.377 * _gEarth, "Soft Rock", "silicate"),
+    "Venus":   _BodyRec(6051.84e3, 0.905 * _gEarth, "Hard Rock", "silicate"),
+    "Earth":   _BodyRec(6371.01e3, 1.000 * _gEarth, "Wet Soil" , "silicate"),
+    "Moon":    _BodyRec(1737.53e3, 0.1657* _gEarth, "Soft Rock", "silicate"),
+    "Mars":    _BodyRec(3389.92e3, 0.379 * _gEarth, "Soft Rock", "silicate"),
+    "Ceres":   _BodyRec(469.7e3,   0.029 * _gEarth, "Ice"      , "ice"),
+    "Vesta":   _BodyRec(262.7e3,   0.025 * _gEarth, "Soft Rock", "silicate"),
+}
+
+# The nested-dict views are built once at import and shared by every instance. This is the format that set_properties and the
+# public catalogue property expect.
+_MATERIAL_CATALOGUE = {name: rec._asdict() for name, rec in _MATERIALS.items()}
+_BODY_CATALOGUE = {name: rec._asdict() for name, rec in _BODIES.items()}
+
 class Material:
     """
     Represents the material properties relevant to the crater simulation.
@@ -103,26 +147,12 @@ class Material:
     def catalogue(self, value):
                       
         if not isinstance(value, dict) and value is not None:
-            raise TypeError("catalogue must be a dict or None") 
-             
-        # Define some default crater scaling relationship terms (see Richardson 2009, Table 1, and Kraus et al. 2011 for Ice) 
-        material_properties = [
-            "name",       "K1",     "mu",   "Ybar",     "density" 
-        ]
-        material_values = [
-            ("Water",     2.30,     0.55,   0.0,        1000.0),
-            ("Sand",      0.24,     0.41,   0.0,        1750.0),
-            ("Dry Soil",  0.24,     0.41,   0.18e6,     1500.0),
-            ("Wet Soil",  0.20,     0.55,   1.14e6,     2000.0),
-            ("Soft Rock", 0.20,     0.55,   7.60e6,     2250.0),
-            ("Hard Rock", 0.20,     0.55,   18.0e6,     2500.0),
-            ("Ice",       15.625,   0.48,   0.0,        900.0), 
-        ]        
-       
-        if value is None: 
-            self._catalogue = create_catalogue(material_properties, material_values)
+            raise TypeError("catalogue must be a dict or None")
+
+        if value is None:
+            self._catalogue = _MATERIAL_CATALOGUE
         else:
-            self._catalogue = value    
+            self._catalogue = value
 
     @property
     def name(self):
@@ -352,26 +382,11 @@ class Target:
         
         if not isinstance(value, dict) and value is not None:
             raise TypeError("catalogue must be a dict or None")
-        
-        # Define some built-in catalogue values for known solar system targets of interest
-        gEarth = np.float64(9.80665) # 1 g in SI units
-        body_properties = [
-            "name",    "radius",   "gravity",      "material_name", "transition_scale_type"
-        ]
-        body_values = [
-            ("Mercury", 2440.0e3,  0.377 * gEarth, "Soft Rock", "silicate"),
-            ("Venus",   6051.84e3, 0.905 * gEarth, "Hard Rock", "silicate"),
-            ("Earth",   6371.01e3, 1.000 * gEarth, "Wet Soil" , "silicate"),
-            ("Moon",    1737.53e3, 0.1657* gEarth, "Soft Rock", "silicate"),
-            ("Mars",    3389.92e3, 0.379 * gEarth, "Soft Rock", "silicate"),
-            ("Ceres",   469.7e3,   0.029 * gEarth, "Ice"      , "ice"),
-            ("Vesta",   262.7e3,   0.025 * gEarth, "Soft Rock", "silicate"),
-        ]
-        
-        if value is None: 
-            self._catalogue = create_catalogue(body_properties, body_values)
+
+        if value is None:
+            self._catalogue = _BODY_CATALOGUE
         else:
-            self._catalogue = value    
+            self._catalogue = value
     
 
     def set_properties(self, **kwargs):
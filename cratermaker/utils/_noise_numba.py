@@ -0,0 +1,398 @@
+import numpy as np
+from numba import njit, prange
+
+from .custom_types import NoiseModel
+
+# Pure-Python/Numba fallback for the compiled Perlin noise kernels in cratermaker.cython.perlin. The octave accumulators below are
+# direct ports of the Fortran implementations in src/perlin/perlin_submodule.f90 and produce identical noise values. The kernels
+# are dispatched on the integer NoiseModel id rather than the model name string so that the jitted inner loop stays monomorphic.
+
+# Ken Perlin's permutation table, repeated twice to avoid index wrapping
+_PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+    74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+    52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+    207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+    119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+    218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+    81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+], dtype=np.int64)
+_P = np.concatenate((_PERM, _PERM))
+
+# Correction factor that scales the raw noise to approximately the range [-1, 1]
+_HCORRECTION = 1.25
+
+# Number of nodes processed per parallel block. Each thread works through a contiguous block of coordinates small enough to stay
+# resident in L2 cache across all octaves, while the anchor array stays in L1.
+_BLOCK_SIZE = 4096
+
+
+@njit(cache=True)
+def _fade(t):
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+@njit(cache=True)
+def _dfade(t):
+    return t * t * (t * (t * 30.0 - 60.0) + 30.0)
+
+
+@njit(cache=True)
+def _lerp(t, a, b):
+    return a + t * (b - a)
+
+
+@njit(cache=True)
+def _dlerp(t, a, b, dt, da, db):
+    return da + t * (db - da) + dt * (b - a)
+
+
+@njit(cache=True)
+def _grad(hash, x, y, z):
+    h = hash & 15
+    if h < 8:
+        u = x
+    else:
+        u = y
+    if h < 4:
+        v = y
+    elif (h == 12) or (h == 14):
+        v = x
+    else:
+        v = z
+    if (h & 1) == 0:
+        g = u
+    else:
+        g = -u
+    if (h & 2) == 0:
+        g = g + v
+    else:
+        g = g - v
+    return g
+
+
+@njit(cache=True)
+def _perlin_noise(xx, yy, zz):
+    # Perlin noise with derivatives. Adapted from Ken Perlin's original code, with derivatives that are used in the noise
+    # functions by Giliam de Carpentier. Returns (noise, dx, dy, dz).
+    xi = int(np.floor(xx)) & 255
+    yi = int(np.floor(yy)) & 255
+    zi = int(np.floor(zz)) & 255
+    x = xx - np.floor(xx)
+    y = yy - np.floor(yy)
+    z = zz - np.floor(zz)
+    u = _fade(x)
+    v = _fade(y)
+    w = _fade(z)
+
+    A = _P[xi] + yi
+    B = _P[xi + 1] + yi
+
+    AA = _P[A] + zi
+    BA = _P[B] + zi
+
+    AB = _P[A + 1] + zi
+    BB = _P[B + 1] + zi
+
+    GA1 = _grad(_P[AA], x, y, z)
+    GB1 = _grad(_P[BA], x - 1.0, y, z)
+    GA2 = _grad(_P[AB], x, y - 1.0, z)
+    GB2 = _grad(_P[BB], x - 1.0, y - 1.0, z)
+    GA3 = _grad(_P[AA + 1], x, y, z - 1.0)
+    GB3 = _grad(_P[BA + 1], x - 1.0, y, z - 1.0)
+    GA4 = _grad(_P[AB + 1], x, y - 1.0, z - 1.0)
+    GB4 = _grad(_P[BB + 1], x - 1.0, y - 1.0, z - 1.0)
+
+    L1 = _lerp(u, GA1, GB1)
+    L2 = _lerp(u, GA2, GB2)
+    L3 = _lerp(u, GA3, GB3)
+    L4 = _lerp(u, GA4, GB4)
+
+    LL1 = _lerp(v, L1, L2)
+    LL2 = _lerp(v, L3, L4)
+
+    noise = _HCORRECTION * _lerp(w, LL1, LL2)
+
+    # Calculate derivatives wrt x
+    ux = _dfade(x)
+    GA1x = _grad(_P[AA], 1.0, 0.0, 0.0)
+    GB1x = _grad(_P[BA], 1.0, 0.0, 0.0)
+    GA2x = _grad(_P[AB], 1.0, 0.0, 0.0)
+    GB2x = _grad(_P[BB], 1.0, 0.0, 0.0)
+    GA3x = _grad(_P[AA + 1], 1.0, 0.0, 0.0)
+    GB3x = _grad(_P[BA + 1], 1.0, 0.0, 0.0)
+    GA4x = _grad(_P[AB + 1], 1.0, 0.0, 0.0)
+    GB4x = _grad(_P[BB + 1], 1.0, 0.0, 0.0)
+
+    L1x = _dlerp(u, GA1, GB1, ux, GA1x, GB1x)
+    L2x = _dlerp(u, GA2, GB2, ux, GA2x, GB2x)
+    L3x = _dlerp(u, GA3, GB3, ux, GA3x, GB3x)
+    L4x = _dlerp(u, GA4, GB4, ux, GA4x, GB4x)
+
+    LL1x = _dlerp(v, L1, L2, 0.0, L1x, L2x)
+    LL2x = _dlerp(v, L3, L4, 0.0, L3x, L4x)
+
+    dx = _HCORRECTION * _dlerp(w, LL1, LL2, 0.0, LL1x, LL2x)
+
+    # Calculate derivatives wrt y
+    vy = _dfade(y)
+    GA1y = _grad(_P[AA], 0.0, 1.0, 0.0)
+    GB1y = _grad(_P[BA], 0.0, 1.0, 0.0)
+    GA2y = _grad(_P[AB], 0.0, 1.0, 0.0)
+    GB2y = _grad(_P[BB], 0.0, 1.0, 0.0)
+    GA3y = _grad(_P[AA + 1], 0.0, 1.0, 0.0)
+    GB3y = _grad(_P[BA + 1], 0.0, 1.0, 0.0)
+    GA4y = _grad(_P[AB + 1], 0.0, 1.0, 0.0)
+    GB4y = _grad(_P[BB + 1], 0.0, 1.0, 0.0)
+
+    L1y = _dlerp(u, GA1, GB1, 0.0, GA1y, GB1y)
+    L2y = _dlerp(u, GA2, GB2, 0.0, GA2y, GB2y)
+    L3y = _dlerp(u, GA3, GB3, 0.0, GA3y, GB3y)
+    L4y = _dlerp(u, GA4, GB4, 0.0, GA4y, GB4y)
+
+    LL1y = _dlerp(v, L1, L2, vy, L1y, L2y)
+    LL2y = _dlerp(v, L3, L4, vy, L3y, L4y)
+
+    dy = _HCORRECTION * _dlerp(w, LL1, LL2, 0.0, LL1y, LL2y)
+
+    # Calculate derivatives wrt z
+    wz = _dfade(z)
+    GA1z = _grad(_P[AA], 0.0, 0.0, 1.0)
+    GB1z = _grad(_P[BA], 0.0, 0.0, 1.0)
+    GA2z = _grad(_P[AB], 0.0, 0.0, 1.0)
+    GB2z = _grad(_P[BB], 0.0, 0.0, 1.0)
+    GA3z = _grad(_P[AA + 1], 0.0, 0.0, 1.0)
+    GB3z = _grad(_P[BA + 1], 0.0, 0.0, 1.0)
+    GA4z = _grad(_P[AB + 1], 0.0, 0.0, 1.0)
+    GB4z = _grad(_P[BB + 1], 0.0, 0.0, 1.0)
+
+    L1z = _dlerp(u, GA1, GB1, 0.0, GA1z, GB1z)
+    L2z = _dlerp(u, GA2, GB2, 0.0, GA2z, GB2z)
+    L3z = _dlerp(u, GA3, GB3, 0.0, GA3z, GB3z)
+    L4z = _dlerp(u, GA4, GB4, 0.0, GA4z, GB4z)
+
+    LL1z = _dlerp(v, L1, L2, 0.0, L1z, L2z)
+    LL2z = _dlerp(v, L3, L4, 0.0, L3z, L4z)
+
+    dz = _HCORRECTION * _dlerp(w, LL1, LL2, wz, LL1z, LL2z)
+
+    return noise, dx, dy, dz
+
+
+@njit(cache=True)
+def _turbulence(x, y, z, noise_height, freq, pers, num_octaves, anchor):
+    noise = 0.0
+    norm = 0.5
+    for i in range(num_octaves):
+        spatial_fac = freq**i
+        noise_mag = pers**i
+        norm = norm + 0.5 * noise_mag
+        xnew = (x + anchor[i, 0]) * spatial_fac
+        ynew = (y + anchor[i, 1]) * spatial_fac
+        znew = (z + anchor[i, 2]) * spatial_fac
+        dn, _, _, _ = _perlin_noise(xnew, ynew, znew)
+        noise = noise + dn * noise_mag
+
+    return noise * noise_height / norm
+
+
+@njit(cache=True)
+def _billowed(x, y, z, noise_height, freq, pers, num_octaves, anchor):
+    return abs(_turbulence(x, y, z, noise_height, freq, pers, num_octaves, anchor))
+
+
+@njit(cache=True)
+def _plaw(x, y, z, noise_height, freq, pers, slope, num_octaves, anchor):
+    noise = _turbulence(x, y, z, noise_height, freq, pers, num_octaves, anchor)
+    return np.sign(noise) * abs(noise)**slope
+
+
+@njit(cache=True)
+def _ridged(x, y, z, noise_height, freq, pers, num_octaves, anchor):
+    return noise_height - abs(_turbulence(x, y, z, noise_height, freq, pers, num_octaves, anchor))
+
+
+@njit(cache=True)
+def _swiss(x, y, z, lacunarity, gain, warp, num_octaves, anchor):
+    noise = 0.0
+    freq = 1.0
+    amp = 1.0
+    dsum_x = 0.0
+    dsum_y = 0.0
+    dsum_z = 0.0
+
+    for i in range(num_octaves):
+        xnew = (x + anchor[i, 0] + warp * dsum_x) * freq
+        ynew = (y + anchor[i, 1] + warp * dsum_y) * freq
+        znew = (z + anchor[i, 2] + warp * dsum_z) * freq
+        n, ndx, ndy, ndz = _perlin_noise(xnew, ynew, znew)
+        noise = noise + amp * (1.0 - abs(n))
+        dsum_x = dsum_x + amp * ndx * (-n)
+        dsum_y = dsum_y + amp * ndy * (-n)
+        dsum_z = dsum_z + amp * ndz * (-n)
+        freq = freq * lacunarity
+        amp = amp * gain * max(min(noise, 1.0), 0.0)
+
+    return noise
+
+
+@njit(cache=True)
+def _jordan(x, y, z, lacunarity, gain0, gain, warp0, warp, damp0, damp, damp_scale, num_octaves, anchor):
+    n, ndx, ndy, ndz = _perlin_noise(x + anchor[0, 0], y + anchor[0, 1], z + anchor[0, 2])
+    n2 = n * n
+    n2x = ndx * n
+    n2y = ndy * n
+    n2z = ndz * n
+    noise = n2
+    dsum_warp_x = warp0 * n2x
+    dsum_warp_y = warp0 * n2y
+    dsum_warp_z = warp0 * n2z
+    dsum_damp_x = damp0 * n2x
+    dsum_damp_y = damp0 * n2y
+    dsum_damp_z = damp0 * n2z
+
+    freq = lacunarity
+    amp = gain0
+    damped_amp = amp * gain
+
+    for i in range(1, num_octaves):
+        xnew = x * freq + dsum_warp_x + anchor[i, 0]
+        ynew = y * freq + dsum_warp_y + anchor[i, 1]
+        znew = z * freq + dsum_warp_z + anchor[i, 2]
+        n, ndx, ndy, ndz = _perlin_noise(xnew, ynew, znew)
+        n2 = n * n
+        n2x = ndx * n
+        n2y = ndy * n
+        n2z = ndz * n
+        noise = noise + damped_amp * n2
+        dsum_warp_x = dsum_warp_x + warp * n2x
+        dsum_warp_y = dsum_warp_y + warp * n2y
+        dsum_warp_z = dsum_warp_z + warp * n2z
+        dsum_damp_x = dsum_damp_x + damp * n2x
+        dsum_damp_y = dsum_damp_y + damp * n2y
+        dsum_damp_z = dsum_damp_z + damp * n2z
+        freq = freq * lacunarity
+        amp = amp * gain
+        damped_amp = amp * (1.0 - damp_scale / (1.0 + dsum_damp_x**2 + dsum_damp_y**2 + dsum_damp_z**2))
+
+    return noise
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def perlin_noise_all(model_id, x, y, z, num_octaves, anchor, damp, damp0, damp_scale, freq, gain, gain0, lacunarity,
+                     noise_height, pers, slope, warp, warp0, noise):
+    num_blocks = (x.size + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+    for b in prange(num_blocks):
+        start = b * _BLOCK_SIZE
+        end = min(start + _BLOCK_SIZE, x.size)
+        for i in range(start, end):
+            if model_id == 0:
+                noise[i] = _turbulence(x[i], y[i], z[i], noise_height, freq, pers, num_octaves, anchor)
+            elif model_id == 1:
+                noise[i] = _billowed(x[i], y[i], z[i], noise_height, freq, pers, num_octaves, anchor)
+            elif model_id == 2:
+                noise[i] = _plaw(x[i], y[i], z[i], noise_height, freq, pers, slope, num_octaves, anchor)
+            elif model_id == 3:
+                noise[i] = _ridged(x[i], y[i], z[i], noise_height, freq, pers, num_octaves, anchor)
+            elif model_id == 4:
+                noise[i] = _swiss(x[i], y[i], z[i], lacunarity, gain, warp, num_octaves, anchor)
+            elif model_id == 5:
+                noise[i] = _jordan(x[i], y[i], z[i], lacunarity, gain0, gain, warp0, warp, damp0, damp, damp_scale,
+                                   num_octaves, anchor)
+            else:
+                noise[i] = 0.0
+    return
+
+
+def apply_noise(model, x_array, y_array, z_array, num_octaves, anchor, **kwargs):
+    """
+    Applies Perlin noise based on the specified model and parameters.
+
+    This is a drop-in replacement for cratermaker.cython.perlin.apply_noise for installations where the compiled Fortran
+    extension is unavailable. The octave accumulation is JIT-compiled with Numba and parallelized across nodes; the first call
+    pays a one-time compilation cost which is amortized by on-disk caching.
+
+    Parameters
+    ----------
+    model: str
+        Name of the turbulence model.
+    x_array, y_array, z_array: ndarray (N,)
+        Cartesian coordinates for noise evaluation.
+    num_octaves: int
+        Number of octaves for the noise function.
+    anchor: ndarray (num_octaves, 3)
+        array of spatial anchor points for each noise octave.
+    kwargs: dict
+        Additional model-specific parameters.
+
+    Returns
+    -------
+    ndarray(N,)
+        computed noise value.
+
+    Raises
+    ------
+    ValueError - If required parameters are missing, arrays are mismatched, or if an invalid model is specified.
+    """
+
+    if not (x_array.size == y_array.size == z_array.size):
+        raise ValueError("x, y, and z arrays must have the same length")
+
+    # Ensure memory-contiguous numpy arrays. A float32 input dtype is preserved so that reduced-precision noise generation
+    # halves the memory traffic over the coordinate and output arrays; Numba specializes the kernel for each dtype.
+    dtype = np.float32 if x_array.dtype == np.float32 else np.float64
+    anchor = np.ascontiguousarray(anchor, dtype=dtype)
+    x_array = np.ascontiguousarray(x_array, dtype=dtype)
+    y_array = np.ascontiguousarray(y_array, dtype=dtype)
+    z_array = np.ascontiguousarray(z_array, dtype=dtype)
+    noise_array = np.empty(x_array.size, dtype=dtype)
+
+    model = model.lower()
+    kw = {
+        'damp': 0.0,
+        'damp0': 0.0,
+        'damp_scale': 0.0,
+        'freq': 0.0,
+        'gain': 0.0,
+        'gain0': 0.0,
+        'lacunarity': 0.0,
+        'noise_height': 0.0,
+        'pers': 0.0,
+        'slope': 0.0,
+        'warp': 0.0,
+        'warp0': 0.0
+    }
+    required_kwargs = {
+        'turbulence': ['noise_height', 'freq', 'pers'],
+        'billowed': ['noise_height', 'freq', 'pers'],
+        'plaw': ['noise_height', 'freq', 'pers', 'slope'],
+        'ridged': ['noise_height', 'freq', 'pers'],
+        'swiss': ['lacunarity', 'gain', 'warp'],
+        'jordan': ['lacunarity', 'gain0', 'gain', 'warp0', 'warp', 'damp0', 'damp', 'damp_scale'],
+    }
+
+    if model in required_kwargs:
+        # If it is a valid model, make sure we've passed all of the required arguments
+        if set(required_kwargs[model]).issubset(kwargs.keys()):
+            for arg in required_kwargs[model]:
+                kw[arg] = kwargs[arg]
+
+            perlin_noise_all(int(NoiseModel[model.upper()]), x_array, y_array, z_array, num_octaves, anchor, kw['damp'], kw['damp0'],
+                             kw['damp_scale'], kw['freq'], kw['gain'], kw['gain0'], kw['lacunarity'], kw['noise_height'],
+                             kw['pers'], kw['slope'], kw['warp'], kw['warp0'], noise_array)
+        else:
+            missing_args = set(required_kwargs[model]) - kwargs.keys()
+            raise ValueError(f"The {model} model requires the following missing keywords: {', '.join(missing_args)}")
+    else:
+        raise ValueError(f"{model} is an invalid model. Valid options are {', '.join(required_kwargs.keys())}")
+
+    return noise_array
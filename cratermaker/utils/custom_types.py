@@ -1,5 +1,21 @@
 import numpy as np
+from enum import IntEnum
 from typing import Union, Tuple, List
 
 FloatLike = Union[float, int, np.number]
-PairOfFloats = Union[Tuple[float, float], List[float], np.ndarray]
\ No newline at end of file
+PairOfFloats = Union[Tuple[float, float], List[float], np.ndarray]
+
+
+class NoiseModel(IntEnum):
+    """
+    Integer ids for the supported Perlin noise models.
+
+    The ids match the dispatch values used by the compiled noise kernels, so a model name string only needs to be resolved once
+    at the Python boundary rather than compared repeatedly inside the kernels.
+    """
+    TURBULENCE = 0
+    BILLOWED = 1
+    PLAW = 2
+    RIDGED = 3
+    SWISS = 4
+    JORDAN = 5
\ No newline at end of file
@@ -1,9 +1,35 @@
 import json
+import os
 import numpy as np
+from dataclasses import is_dataclass, fields
+from functools import lru_cache
 from numpy.typing import ArrayLike
 from cratermaker.utils.custom_types import FloatLike, PairOfFloats
 from typing import Callable, Union, Any
 
+@lru_cache(maxsize=None)
+def _settable_keys(cls):
+    """
+    Collect the attribute names reachable through the class (properties, slots, methods, and other class attributes), resolved
+    once per class so that set_properties does not have to probe each keyword with hasattr on every call.
+    """
+    keys = set()
+    for klass in cls.__mro__:
+        keys.update(vars(klass))
+    return frozenset(keys)
+
+
+@lru_cache(maxsize=32)
+def _load_properties_file(path, mtime_ns):
+    """
+    Parse a JSON properties file, caching the result so repeated reads of the same unmodified file are free.
+
+    The modification time is part of the cache key so that an edited file is re-parsed rather than served stale.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 def to_config(obj):
     """
     Serialize the attributes of an object into a dictionary.
@@ -24,14 +50,26 @@ def to_config(obj):
     Notes
     -----
     Only attributes that are instances of basic data types (int, float, str, list, dict, bool, None) are included.
-    Parameters listed in 'config_ignore' of the object are excluded from serialization.
-    """   
+    Parameters listed in 'config_ignore' of the object are excluded from serialization. If the object defines a 'config_fields'
+    attribute, only the attributes named there are considered, which avoids touching large attributes (such as surface meshes)
+    only to reject them.
+    """
     # Check if the object has the attribute 'config_ignore'
     ignores = getattr(obj, 'config_ignore', [])
-        
+
+    # Enumerate only the declared fields when the object provides them, so large attributes are never inspected
+    if is_dataclass(obj):
+        items = [(f.name, getattr(obj, f.name)) for f in fields(obj)]
+    else:
+        config_fields = getattr(obj, 'config_fields', None)
+        if config_fields is not None:
+            items = [(k, obj.__dict__[k]) for k in config_fields if k in obj.__dict__]
+        else:
+            items = obj.__dict__.items()
+
     # Generate a dictionary of serializable attributes, excluding those in 'ignores'
     return {
-        k: v for k, v in obj.__dict__.items()
+        k: v for k, v in items
         if isinstance(v, (int, float, str, list, dict, bool, type(None))) and k not in ignores
     }
   
@@ -60,9 +98,15 @@ def set_properties(obj,**kwargs):
     """
     
     def set_properties_from_arguments(obj, **kwargs):
+        allowed = _settable_keys(type(obj))
+        instance_keys = getattr(obj, '__dict__', {})
         for key, value in kwargs.items():
-            if hasattr(obj, key) and value is not None:
-                setattr(obj, key, value)   
+            if value is None:
+                continue
+            # The cached class-level key set handles the common case; hasattr remains as a fallback for objects that
+            # resolve attributes dynamically (e.g. mocks)
+            if key in allowed or key in instance_keys or hasattr(obj, key):
+                setattr(obj, key, value)
             
     def set_properties_from_catalogue(obj, catalogue, name=None, **kwargs):
         # Check to make sure that the catalogue argument is in the valid nested dict format
@@ -87,9 +131,16 @@ def set_properties(obj,**kwargs):
             set_properties_from_arguments(obj, name=name, **kwargs)
             
     def set_properties_from_file(obj, filename, name=None, **kwargs):
-        with open(filename, 'r') as f:
-            catalogue = json.load(f)
-            
+        try:
+            mtime_ns = os.stat(filename).st_mtime_ns
+        except OSError:
+            # The file cannot be stat'ed, so there is no modification time to key the cache on; parse it without caching
+            with open(filename, 'r') as f:
+                catalogue = json.load(f)
+        else:
+            catalogue = _load_properties_file(os.path.abspath(filename), mtime_ns)
+
+
         set_properties_from_catalogue(obj,catalogue=catalogue,name=name)
         set_properties_from_arguments(obj,name=name)
        
@@ -327,4 +378,8 @@ def R_to_CSFD(
     
         return N
     
-    return _R_to_CSFD_scalar(R, D, Dlim, *args) if np.isscalar(D) else np.vectorize(_R_to_CSFD_scalar)(R, D, Dlim, *args)
\ No newline at end of file
+    if np.isscalar(D):
+        return _R_to_CSFD_scalar(R, D, Dlim, *args)
+    # np.frompyfunc has less per-call overhead than np.vectorize because it does not infer the output dtype on each call
+    vec = np.frompyfunc(lambda Dval: _R_to_CSFD_scalar(R, Dval, Dlim, *args), 1, 1)
+    return vec(D).astype(np.float64, copy=False)
\ No newline at end of file
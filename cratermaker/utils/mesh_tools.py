@@ -3,16 +3,15 @@ from __future__ import absolute_import, division, print_function, \
 
 import numpy as np
 import xarray
-import jigsawpy
-from jigsawpy.savejig import savejig
 import sys
 import logging
 import subprocess
-from netCDF4 import Dataset as NetCDFFile
 import collections
 import importlib.resources
 
-jigsaw_exe = str(importlib.resources.files('jigsawpy').joinpath('_bin').joinpath('jigsaw'))
+# jigsawpy and netCDF4 are heavyweight and only needed when a mesh is actually built, so they are imported inside the
+# functions that use them rather than at module import time
+
 mpas_conversion_tool_exe = str(importlib.resources.files('cratermaker').joinpath('bin').joinpath('MpasMeshConverter.x'))
 
 
@@ -112,6 +111,10 @@ def jigsaw_driver(cellWidth, x, y, on_sphere=True, earth_radius=6371.0e3,
     # Authors
     # -------
     # Mark Petersen, Phillip Wolfram, Xylar Asay-Davis
+    import jigsawpy
+    from jigsawpy.savejig import savejig
+
+    jigsaw_exe = str(importlib.resources.files('jigsawpy').joinpath('_bin').joinpath('jigsaw'))
 
     # setup files for JIGSAW
     opts = jigsawpy.jigsaw_jig_t()
@@ -378,6 +381,7 @@ def jigsaw_to_netcdf(msh_filename, output_name, on_sphere, sphere_radius=None):
         is required, otherwise it is ignored.
     """
     # Authors: Phillip J. Wolfram, Matthew Hoffman and Xylar Asay-Davis
+    from netCDF4 import Dataset as NetCDFFile
 
     grid = NetCDFFile(output_name, 'w', format='NETCDF3_CLASSIC')
 
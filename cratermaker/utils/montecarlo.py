@@ -6,6 +6,35 @@ from numpy.typing import NDArray
 from scipy.stats import truncnorm
 from scipy.stats import maxwell
 
+def make_rngs(
+              seed: Optional[int]=None,
+              n: int=1
+             ) -> list[Generator]:
+    """
+    Create a batch of independent random number generators from a single seed.
+
+    Spawning children from one SeedSequence is cheaper than constructing a fresh seeded generator per simulation, and the
+    resulting streams are statistically independent, which makes this the preferred way to seed an ensemble of Simulation
+    objects (passed in via the `rng` argument).
+
+    Parameters
+    ----------
+    seed : int, optional
+        The seed for the parent SeedSequence. If not provided, the generators are seeded from the operating system.
+    n : int, optional
+        The number of generators to create. Default is 1.
+
+    Returns
+    -------
+    list of numpy.random.Generator
+        A list of `n` independent random number generators.
+    """
+    if n < 1:
+        raise ValueError("The number of generators must be at least 1")
+    ss = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in ss.spawn(n)]
+
+
 def get_random_location(
                         size: int | Tuple[int, ...]=1, 
                         rng: Generator | None=None
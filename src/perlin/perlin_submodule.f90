@@ -465,32 +465,46 @@ contains
 
       N = size(x)
 
+      ! The model dispatch is hoisted outside of the node loop so that each loop body is a single pure function call, which lets
+      ! the OpenMP runtime spread nodes over threads and the compiler vectorize the octave sums across loop iterations.
       select case (trim(model))
       case('turbulence')
-         do concurrent(i = 1:N)
-            noise(i) = perlin_turbulence(x(i), y(i), z(i), noise_height, freq, pers, num_octaves, anchor) 
+         !$omp parallel do simd schedule(static)
+         do i = 1, N
+            noise(i) = perlin_turbulence(x(i), y(i), z(i), noise_height, freq, pers, num_octaves, anchor)
          end do
+         !$omp end parallel do simd
       case('billowed')
-         do concurrent(i = 1:N)
+         !$omp parallel do simd schedule(static)
+         do i = 1, N
             noise(i) = perlin_billowedNoise(x(i), y(i), z(i), noise_height, freq, pers, num_octaves, anchor)
          end do
+         !$omp end parallel do simd
       case('plaw')
-         do concurrent(i = 1:N)
+         !$omp parallel do simd schedule(static)
+         do i = 1, N
             noise(i) = perlin_plawNoise(x(i), y(i), z(i), noise_height, freq, pers, slope, num_octaves, anchor)
          end do
+         !$omp end parallel do simd
       case('ridged')
-         do concurrent(i = 1:N)
+         !$omp parallel do simd schedule(static)
+         do i = 1, N
             noise(i) = perlin_ridgedNoise(x(i), y(i), z(i), noise_height, freq, pers, num_octaves, anchor)
          end do
+         !$omp end parallel do simd
       case('swiss')
-         do concurrent(i = 1:N)
+         !$omp parallel do simd schedule(static)
+         do i = 1, N
             noise(i) = perlin_swissTurbulence(x(i), y(i), z(i), lacunarity, gain, warp, num_octaves, anchor)
          end do
+         !$omp end parallel do simd
       case('jordan')
-         do concurrent(i = 1:N)
-            noise(i) = perlin_jordanTurbulence(x(i), y(i), z(i), lacunarity, gain0, gain, warp0, warp, damp0, damp,& 
-                                                damp_scale, num_octaves, anchor) 
+         !$omp parallel do simd schedule(static)
+         do i = 1, N
+            noise(i) = perlin_jordanTurbulence(x(i), y(i), z(i), lacunarity, gain0, gain, warp0, warp, damp0, damp,&
+                                                damp_scale, num_octaves, anchor)
          end do
+         !$omp end parallel do simd
       case default
          noise(:) = 0.0_DP
       end select
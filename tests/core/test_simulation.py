@@ -68,6 +68,47 @@ class TestSimulation(unittest.TestCase):
         for f in expected_files:
             self.assertTrue(os.path.exists(os.path.join(custom_out_dir, f)))        
            
+    def test_apply_noise_reuse_anchor(self):
+        sim = cratermaker.Simulation(pix=self.pix)
+
+        # A second reuse_anchor call with the same (num_octaves, scale) must sample the same noise field without
+        # advancing the random number generator
+        sim.surf.set_elevation(0.0)
+        sim.apply_noise(num_octaves=4, reuse_anchor=True)
+        noise_first = sim.surf['elevation'].values.copy()
+        state = sim.rng.bit_generator.state
+
+        sim.surf.set_elevation(0.0)
+        sim.apply_noise(num_octaves=4, reuse_anchor=True)
+        noise_second = sim.surf['elevation'].values.copy()
+        np.testing.assert_array_equal(noise_first, noise_second)
+        self.assertEqual(state, sim.rng.bit_generator.state)
+
+        # An explicitly passed anchor bypasses the cache
+        anchor = np.zeros((4, 3))
+        sim.surf.set_elevation(0.0)
+        sim.apply_noise(num_octaves=4, reuse_anchor=True, anchor=anchor)
+        noise_explicit = sim.surf['elevation'].values.copy()
+        self.assertFalse(np.array_equal(noise_first, noise_explicit))
+        return
+
+    def test_apply_noise_single_precision(self):
+        sim = cratermaker.Simulation(pix=self.pix)
+        anchor = np.random.default_rng(seed=5421).uniform(0.0, 1.0, size=(4, 3))
+
+        sim.surf.set_elevation(0.0)
+        sim.apply_noise(num_octaves=4, anchor=anchor)
+        elevation64 = sim.surf['elevation'].values.copy()
+        self.assertEqual(elevation64.dtype, np.float64)
+
+        # The reduced-precision field must stay float64 in the elevation variable and remain close to the float64 result
+        sim.surf.set_elevation(0.0)
+        sim.apply_noise(num_octaves=4, anchor=anchor, single_precision=True)
+        elevation32 = sim.surf['elevation'].values.copy()
+        self.assertEqual(elevation32.dtype, np.float64)
+        np.testing.assert_allclose(elevation32, elevation64, rtol=1e-3, atol=1.0)
+        return
+
     def test_emplace_crater(self):
         sim = cratermaker.Simulation(pix=self.pix)
         sim.emplace_crater(diameter=10e3)
@@ -191,6 +191,17 @@ class TestSurface(unittest.TestCase):
         self.assertAlmostEqual(distances[antipode_idx], antipode_distance, delta=delta, msg=f"Antipode node distance ratio: {distances[antipode_idx].item()/antipode_distance}")
         
         
+    def test_get_node_distance_and_bearing(self):
+        surf = initialize_surface(pix=self.pix, target=self.target, reset_surface=True)
+
+        location = get_random_location()
+
+        # The fused pass duplicates the haversine and bearing formulas, so it must agree with the individual methods
+        distance, bearing = surf.get_node_distance_and_bearing(location)
+        np.testing.assert_allclose(distance, surf.get_node_distance(location), rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(bearing, surf.get_node_initial_bearing(location), rtol=1e-9, atol=1e-9)
+
+
     def test_calculate_initial_bearing(self):
         # Example coordinates (lat/lon in radians)
         lon1, lat1 = np.radians(0), np.radians(0)  # Equator, prime meridian
@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 from cratermaker import to_config, set_properties, check_properties, create_catalogue, validate_and_convert_location, normalize_coords  
 from cratermaker.utils.custom_types import FloatLike
 
@@ -9,11 +10,22 @@ mock_properties = [
 mock_values = [
     ("foo",     1.00,     2.00),
     ("bar",     3.00,     4.00),
-]  
+]
+
+# create_catalogue is a pure function of the constant mock data above, so the catalogue is built once at import time and shared
+_CATALOGUE = create_catalogue(mock_properties, mock_values)
+
 class TestSetProperties(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.catalogue = _CATALOGUE
+        return
+
     def setUp(self):
-        # Set up any initial configurations or objects you need before each test
-        self.mock_object = MagicMock()
+        # Set up any initial configurations or objects you need before each test. A SimpleNamespace is all these tests need,
+        # since they only use the object as an attribute bag; the attributes are seeded because set_properties only assigns to
+        # attributes that already exist
+        self.mock_object = SimpleNamespace(name=None, property1=None, property2=None)
         return
         
     def test_kwargs(self):
@@ -30,13 +42,15 @@ class TestSetProperties(unittest.TestCase):
     
     def test_catalogue(self):
         # Test a regular catalogue with multiple entries (must be selected by  name)
-        catalogue = create_catalogue(mock_properties, mock_values)
-        for k,v in catalogue.items():
-            set_properties(self.mock_object, catalogue=catalogue, name=k)
-            self.assertEqual(self.mock_object.name, k)
-            self.assertEqual(self.mock_object.property1, v['property1'])
-            self.assertEqual(self.mock_object.property2, v['property2'])
-            
+        catalogue = self.catalogue
+        expected = [(k, v['property1'], v['property2']) for k, v in catalogue.items()]
+        for k, property1, property2 in expected:
+            with self.subTest(name=k):
+                set_properties(self.mock_object, catalogue=catalogue, name=k)
+                self.assertEqual((self.mock_object.name, self.mock_object.property1, self.mock_object.property2),
+                                 (k, property1, property2))
+
+
         # Test a single entry catalogue (name can be omitted)
         name = next(iter(catalogue))
         set_properties(self.mock_object, catalogue={name:catalogue[name]})
@@ -54,10 +68,12 @@ class TestSetProperties(unittest.TestCase):
         
         return
 
-    @patch('builtins.open', create=True)  # Adjust 'your_module' accordingly
-    def test_json_file_setting(self, mock_open):
-        # Mock reading from a JSON file
-        mock_open.return_value.__enter__.return_value.read.return_value = '{"qux":{"property1":7.0,"property2":8.0},"quux":{"property1":9.0,"property2":10.0}}'
+    @patch('cratermaker.utils.general_utils.json.load')
+    @patch('builtins.open', create=True)
+    def test_json_file_setting(self, mock_open, mock_json_load):
+        # Mock reading from a JSON file. json.load is patched to return the parsed payload directly, so each call skips the
+        # tokenizer instead of re-parsing an identical string
+        mock_json_load.return_value = {"qux": {"property1": 7.0, "property2": 8.0}, "quux": {"property1": 9.0, "property2": 10.0}}
         set_properties(self.mock_object, filename='dummy.json', name='qux')
         self.assertEqual(self.mock_object.name, 'qux')
         self.assertEqual(self.mock_object.property1, 7.0)
@@ -70,7 +86,7 @@ class TestSetProperties(unittest.TestCase):
         
     def test_kwarg_override(self):
         property2_new = 42.0
-        catalogue = create_catalogue(mock_properties, mock_values)
+        catalogue = self.catalogue
         name = next(iter(catalogue))
         set_properties(self.mock_object, catalogue=catalogue, name=name, property2=property2_new)
         self.assertEqual(self.mock_object.name, name)
@@ -6,6 +6,29 @@ from scipy.stats import chisquare, ks_2samp, poisson
 
 class TestMonteCarlo(unittest.TestCase):
 
+    def test_make_rngs(self):
+        """Test make_rngs return length, reproducibility, stream independence, and input validation."""
+        n = 4
+        rngs = make_rngs(seed=42, n=n)
+        self.assertEqual(len(rngs), n)
+
+        # The same seed must reproduce identical streams
+        rngs_repeat = make_rngs(seed=42, n=n)
+        draws = [rng.random(10) for rng in rngs]
+        draws_repeat = [rng.random(10) for rng in rngs_repeat]
+        for a, b in zip(draws, draws_repeat):
+            np.testing.assert_array_equal(a, b)
+
+        # Distinct children must produce distinct streams
+        for i in range(n):
+            for j in range(i + 1, n):
+                self.assertFalse(np.array_equal(draws[i], draws[j]))
+
+        with self.assertRaises(ValueError):
+            make_rngs(seed=42, n=0)
+        return
+
+
     def test_get_random_location(self):
         """Test get_random_location with default parameters."""
         # Do three trials. If all three fail, the test fails.
@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+from cratermaker.utils._noise_numba import apply_noise
+
+try:
+    from cratermaker.cython.perlin import apply_noise as apply_noise_compiled
+except ImportError:
+    apply_noise_compiled = None
+
+# Model-specific parameters mirroring the defaults that Simulation.apply_noise passes to the kernels
+_MODEL_KWARGS = {
+    "turbulence": {"noise_height": 1.0, "freq": 2.0, "pers": 0.5},
+    "billowed":   {"noise_height": 1.0, "freq": 2.0, "pers": 0.5},
+    "plaw":       {"noise_height": 1.0, "freq": 2.0, "pers": 0.5, "slope": 2.0},
+    "ridged":     {"noise_height": 1.0, "freq": 2.0, "pers": 0.5},
+    "swiss":      {"lacunarity": 2.0, "gain": 0.5, "warp": 0.35},
+    "jordan":     {"lacunarity": 2.0, "gain0": 0.8, "gain": 0.5, "warp0": 0.4, "warp": 0.35,
+                   "damp0": 1.0, "damp": 0.8, "damp_scale": 1.0},
+}
+
+class TestNoiseNumba(unittest.TestCase):
+    def setUp(self):
+        # A fixed seed makes the anchor and sample points reproducible across runs
+        rng = np.random.default_rng(seed=5421)
+        self.num_octaves = 4
+        self.anchor = rng.uniform(0.0, 2.0, size=(self.num_octaves, 3))
+        self.x, self.y, self.z = rng.uniform(-1.0, 1.0, size=(3, 128))
+        return
+
+    def test_noise_models(self):
+        # Each model must produce a finite, non-constant float64 array of the input shape, and be deterministic for a fixed anchor
+        for model, kwargs in _MODEL_KWARGS.items():
+            with self.subTest(model=model):
+                noise = apply_noise(model, self.x, self.y, self.z, self.num_octaves, self.anchor, **kwargs)
+                self.assertEqual(noise.shape, self.x.shape)
+                self.assertEqual(noise.dtype, np.float64)
+                self.assertTrue(np.all(np.isfinite(noise)))
+                self.assertGreater(np.ptp(noise), 0.0)
+                repeat = apply_noise(model, self.x, self.y, self.z, self.num_octaves, self.anchor, **kwargs)
+                np.testing.assert_array_equal(noise, repeat)
+        return
+
+    def test_single_precision(self):
+        # A float32 input dtype must be preserved end-to-end, and the reduced-precision noise must stay close to float64
+        x32 = self.x.astype(np.float32)
+        y32 = self.y.astype(np.float32)
+        z32 = self.z.astype(np.float32)
+        for model, kwargs in _MODEL_KWARGS.items():
+            with self.subTest(model=model):
+                noise64 = apply_noise(model, self.x, self.y, self.z, self.num_octaves, self.anchor, **kwargs)
+                noise32 = apply_noise(model, x32, y32, z32, self.num_octaves, self.anchor, **kwargs)
+                self.assertEqual(noise32.dtype, np.float32)
+                np.testing.assert_allclose(noise32, noise64, rtol=5e-3, atol=5e-3)
+        return
+
+    def test_invalid_model(self):
+        with self.assertRaises(ValueError):
+            apply_noise("vorticity", self.x, self.y, self.z, self.num_octaves, self.anchor,
+                        noise_height=1.0, freq=2.0, pers=0.5)
+        return
+
+    def test_missing_kwargs(self):
+        # Dropping any one required parameter must raise for every model
+        for model, kwargs in _MODEL_KWARGS.items():
+            for dropped in kwargs:
+                with self.subTest(model=model, dropped=dropped):
+                    incomplete = {k: v for k, v in kwargs.items() if k != dropped}
+                    with self.assertRaises(ValueError):
+                        apply_noise(model, self.x, self.y, self.z, self.num_octaves, self.anchor, **incomplete)
+        return
+
+    def test_mismatched_arrays(self):
+        with self.assertRaises(ValueError):
+            apply_noise("turbulence", self.x, self.y, self.z[:-1], self.num_octaves, self.anchor,
+                        noise_height=1.0, freq=2.0, pers=0.5)
+        return
+
+    @unittest.skipIf(apply_noise_compiled is None, "the compiled Perlin extension is not available")
+    def test_parity_with_compiled_extension(self):
+        # The Numba port must reproduce the compiled Fortran kernels for every model
+        for model, kwargs in _MODEL_KWARGS.items():
+            with self.subTest(model=model):
+                expected = apply_noise_compiled(model, self.x, self.y, self.z, self.num_octaves, self.anchor, **kwargs)
+                noise = apply_noise(model, self.x, self.y, self.z, self.num_octaves, self.anchor, **kwargs)
+                np.testing.assert_allclose(noise, expected, rtol=1e-12, atol=1e-12)
+        return
+
+if __name__ == '__main__':
+    unittest.main()